@@ -1,8 +1,11 @@
+import time
+from concurrent.futures import ProcessPoolExecutor
+
 import streamlit as st
 import pandas as pd
 import db_utils
 import analysis_functions
-from psycopg2.extras import execute_batch # Import the high-performance tool
+from psycopg2.extras import execute_values # Import the high-performance tool
 
 # --- Page Configuration ---
 st.set_page_config(
@@ -14,6 +17,7 @@ st.set_page_config(
 # --- Database Connection ---
 try:
     db_utils.init_connection_pool()
+    analysis_functions.warm_up_jit()  # Pre-pay JIT compilation at startup
 except Exception as e:
     st.error(f"Failed to connect to the database. Please check your .env file and connection. Error: {e}")
     st.stop()
@@ -43,6 +47,28 @@ def load_saved_patterns():
     finally:
         db_utils.release_connection(conn)
 
+@st.cache_resource
+def get_compare_executor() -> ProcessPoolExecutor:
+    """
+    Process pool for running genome comparisons off the script-run thread.
+
+    Comparison is pure numeric work, so processes (not threads) are the
+    right executor; st.cache_resource makes the pool survive reruns.
+    """
+    return ProcessPoolExecutor(max_workers=2)
+
+@st.cache_data(max_entries=16, ttl=3600)
+def get_sequence(genome_id: int) -> str:
+    """
+    Fetches a genome's full sequence, cached in-process.
+
+    Sequences can be megabytes, and every widget interaction reruns the
+    script — caching turns repeated fetches of the same genome into a
+    dict lookup instead of a network transfer. Cache misses go through
+    the binary COPY fast path.
+    """
+    return db_utils.fetch_sequence_fast(genome_id)
+
 # --- Main Application UI ---
 st.title("🧬 Genetic Sequence Analyzer")
 st.markdown("An interactive tool to search for patterns and compare genomic variations using a live Supabase database.")
@@ -80,17 +106,52 @@ if tool_choice == "Pattern Search":
         else:
             pattern_to_search = st.text_input("2. Or Enter a Custom Regex Pattern", value="GAATTC")
 
+    show_full_matches = st.checkbox(
+        "Show full match list",
+        value=True,
+        help="Uncheck to only count matches — the count is computed server-side, so nothing heavy crosses the network."
+    )
+
     if st.button("Search for Pattern", type="primary"):
         if not pattern_to_search:
             st.warning("Please enter a pattern to search for.")
+        elif not show_full_matches:
+            with st.spinner(f"Counting '{pattern_to_search}' in genome {selected_genome_id}..."):
+                try:
+                    conn = db_utils.get_connection()
+                    try:
+                        match_count = db_utils.count_pattern_matches(conn, selected_genome_id, pattern_to_search)
+                    finally:
+                        db_utils.release_connection(conn)
+
+                    if match_count is None:
+                        # Pattern unsupported server-side; count in Python
+                        sequence = get_sequence(selected_genome_id)
+                        match_count = len(analysis_functions.find_patterns_regex(sequence, pattern_to_search))
+                    st.success(f"Found {match_count} match(es)!")
+                except Exception as e:
+                    st.error(f"An error occurred during search: {e}")
         else:
             with st.spinner(f"Searching for '{pattern_to_search}' in genome {selected_genome_id}..."):
-                conn = db_utils.get_connection()
                 try:
-                    with conn.cursor() as cur:
-                        cur.execute("SELECT sequence FROM genomes WHERE genome_id = %s;", (selected_genome_id,))
-                        sequence = cur.fetchone()[0]
-                    matches = analysis_functions.find_patterns_regex(sequence, pattern_to_search)
+                    # Run the search server-side so only the matches cross
+                    # the network, not the whole sequence. Patterns the
+                    # PostgreSQL regex engine rejects fall back to the
+                    # in-Python path over the cached sequence.
+                    conn = db_utils.get_connection()
+                    try:
+                        sql_matches = db_utils.find_patterns_sql(conn, selected_genome_id, pattern_to_search)
+                    finally:
+                        db_utils.release_connection(conn)
+
+                    if sql_matches is not None:
+                        matches = [
+                            {'start': start, 'end': start + len(matched), 'matched_sequence': matched}
+                            for start, matched in sql_matches
+                        ]
+                    else:
+                        sequence = get_sequence(selected_genome_id)
+                        matches = analysis_functions.find_patterns_regex(sequence, pattern_to_search)
                     st.success(f"Found {len(matches)} match(es)!")
                     if matches:
                         df = pd.DataFrame(matches)
@@ -99,8 +160,6 @@ if tool_choice == "Pattern Search":
                         st.dataframe(df)
                 except Exception as e:
                     st.error(f"An error occurred during search: {e}")
-                finally:
-                    db_utils.release_connection(conn)
 
 
 # --- Tool 2: Variation Comparison ---
@@ -113,6 +172,7 @@ elif tool_choice == "Variation Comparison":
         st.session_state.ref_seq_len = 0
         st.session_state.comp_seq_len = 0
         st.session_state.comp_genome_id_to_log = None
+        st.session_state.compare_future = None
 
     genome_list = load_genome_list()
     col1, col2 = st.columns(2)
@@ -126,33 +186,47 @@ elif tool_choice == "Variation Comparison":
         if ref_genome_id == comp_genome_id:
             st.warning("Please select two different genomes to compare.")
         else:
-            with st.spinner(f"Comparing genome {ref_genome_id} with {comp_genome_id}..."):
-                conn = db_utils.get_connection()
+            with st.spinner(f"Fetching genomes {ref_genome_id} and {comp_genome_id}..."):
                 try:
-                    with conn.cursor() as cur:
-                        cur.execute("SELECT sequence FROM genomes WHERE genome_id = %s;", (ref_genome_id,))
-                        ref_sequence = cur.fetchone()[0]
-                        cur.execute("SELECT sequence FROM genomes WHERE genome_id = %s;", (comp_genome_id,))
-                        comp_sequence = cur.fetchone()[0]
-                    
-                    # Store results AND other needed data in session state
-                    st.session_state.variations = analysis_functions.detect_mutations_simple(ref_sequence, comp_sequence)
-                    # *** FIX 1: Save the lengths and ID to session state ***
+                    ref_sequence = get_sequence(ref_genome_id)
+                    comp_sequence = get_sequence(comp_genome_id)
+
+                    # Only the lengths are needed on later reruns (for the
+                    # variation-rate metric), so stash those rather than the
+                    # full sequences — the heavy strings stay in the
+                    # get_sequence cache and are never refetched just for len().
                     st.session_state.ref_seq_len = len(ref_sequence)
                     st.session_state.comp_seq_len = len(comp_sequence)
                     st.session_state.comp_genome_id_to_log = comp_genome_id
 
+                    # Hand the heavy comparison to the process pool so the
+                    # script-run thread (and the UI) stays responsive.
+                    st.session_state.compare_future = get_compare_executor().submit(
+                        analysis_functions.detect_mutations_simple, ref_sequence, comp_sequence
+                    )
                 except Exception as e:
                     st.error(f"An error occurred during comparison: {e}")
-                finally:
-                    db_utils.release_connection(conn)
+
+    # --- Poll the Background Comparison ---
+    if st.session_state.compare_future is not None:
+        if st.session_state.compare_future.done():
+            future = st.session_state.compare_future
+            st.session_state.compare_future = None
+            try:
+                st.session_state.variations = future.result()
+            except Exception as e:
+                st.error(f"An error occurred during comparison: {e}")
+        else:
+            st.info("Comparison running in the background...")
+            time.sleep(0.5)
+            st.rerun()
 
     # --- Display Results and Logging Button ---
     if st.session_state.variations is not None:
         variations = st.session_state.variations
         st.success(f"Comparison complete! Found {len(variations)} variations.")
         
-        # *** FIX 2: Use the saved lengths from session state ***
+        # Use the saved lengths from session state; no sequence refetch needed
         seq_len = min(st.session_state.ref_seq_len, st.session_state.comp_seq_len)
         
         variation_rate = (len(variations) / seq_len) * 100 if seq_len > 0 else 0
@@ -169,12 +243,18 @@ elif tool_choice == "Variation Comparison":
                     conn = db_utils.get_connection()
                     try:
                         with conn.cursor() as cur:
-                            # *** FIX 3: Use the saved ID from session state ***
+                            # Use the saved ID from session state
                             comp_genome_id = st.session_state.comp_genome_id_to_log
-                            mutations_to_log = [(comp_genome_id, v['type'], v['position'], v['original'], v['mutated']) for v in variations]
-                            sql_template = "INSERT INTO mutations (genome_id, mutation_type, position, original_sequence, mutated_sequence) VALUES (%s, %s, %s, %s, %s)"
-                            
-                            execute_batch(cur, sql_template, mutations_to_log)
+                            # A generator keeps peak memory at one page of
+                            # tuples instead of materializing all N up front
+                            # (whole-genome comparisons can yield millions)
+                            mutations_to_log = (
+                                (comp_genome_id, v['type'], v['position'], v['original'], v['mutated'])
+                                for v in variations
+                            )
+                            sql_template = "INSERT INTO mutations (genome_id, mutation_type, position, original_sequence, mutated_sequence) VALUES %s"
+
+                            execute_values(cur, sql_template, mutations_to_log, page_size=1000)
                             
                             conn.commit()
                             st.success("✅ Transaction successful. All variations logged to the database!")
@@ -1,4 +1,7 @@
+import io
 import os
+import struct
+
 import psycopg2
 from psycopg2 import pool
 from dotenv import load_dotenv
@@ -10,14 +13,23 @@ load_dotenv()
 connection_pool = None
 
 def init_connection_pool():
-    """Initializes the database connection pool using credentials from the .env file."""
+    """
+    Initializes the database connection pool using credentials from the .env file.
+
+    Uses ThreadedConnectionPool because Streamlit serves concurrent user
+    sessions from multiple threads; SimpleConnectionPool is not
+    thread-safe. Pool size comes from DB_POOL_MIN/DB_POOL_MAX so
+    deployments with many concurrent tabs aren't serialized behind a
+    handful of connections. getconn/putconn are already the right
+    thread-safe API, so call sites are unchanged.
+    """
     global connection_pool
     if connection_pool is None:
         try:
             print("Initializing database connection pool...")
-            connection_pool = pool.SimpleConnectionPool(
-                1,  # minconn: start with 1 connection
-                5,  # maxconn: can grow to 5 connections
+            connection_pool = pool.ThreadedConnectionPool(
+                int(os.getenv("DB_POOL_MIN", 2)),
+                int(os.getenv("DB_POOL_MAX", 20)),
                 host=os.getenv("DB_HOST"),
                 dbname=os.getenv("DB_NAME"),
                 user=os.getenv("DB_USER"),
@@ -40,6 +52,135 @@ def release_connection(conn):
     if connection_pool:
         connection_pool.putconn(conn)
 
+# Fixed 11-byte signature that opens PostgreSQL's binary COPY stream
+_COPY_BINARY_SIGNATURE = b'PGCOPY\n\xff\r\n\x00'
+
+def fetch_sequence_fast(genome_id):
+    """
+    Fetches a genome's full sequence via binary-format COPY.
+
+    Large sequences fetched through the normal text protocol pay escape
+    processing on both client and server; COPY ... TO STDOUT WITH BINARY
+    ships the raw column bytes instead. The stream is a fixed 19-byte
+    header (signature, flags, extension length), then per row a 2-byte
+    field count and a 4-byte length prefix per field. Falls back to a
+    plain SELECT if COPY fails.
+
+    Returns the sequence string, or None if the genome does not exist.
+    """
+    # COPY statements take no bind parameters, so validate and inline the id
+    genome_id = int(genome_id)
+    conn = get_connection()
+    try:
+        buf = io.BytesIO()
+        try:
+            with conn.cursor() as cur:
+                cur.copy_expert(
+                    f"COPY (SELECT sequence FROM genomes WHERE genome_id = {genome_id}) TO STDOUT WITH BINARY",
+                    buf
+                )
+        except psycopg2.Error:
+            conn.rollback()
+            with conn.cursor() as cur:
+                cur.execute("SELECT sequence FROM genomes WHERE genome_id = %s;", (genome_id,))
+                row = cur.fetchone()
+                return row[0] if row else None
+
+        data = buf.getvalue()
+        if not data.startswith(_COPY_BINARY_SIGNATURE):
+            raise ValueError("Unexpected binary COPY header from server")
+        offset = len(_COPY_BINARY_SIGNATURE)
+        _flags, extension_length = struct.unpack_from('!II', data, offset)
+        offset += 8 + extension_length
+
+        (field_count,) = struct.unpack_from('!h', data, offset)
+        offset += 2
+        if field_count == -1:  # file trailer: no rows, genome not found
+            return None
+        (field_length,) = struct.unpack_from('!i', data, offset)
+        offset += 4
+        if field_length == -1:  # NULL sequence
+            return None
+        return data[offset:offset + field_length].decode('ascii')
+    finally:
+        release_connection(conn)
+
+def find_patterns_sql(conn, genome_id, regex_pattern):
+    """
+    Runs a pattern search server-side with PostgreSQL's regexp engine.
+
+    Only the matches come back over the wire instead of the whole
+    sequence, which is the dominant cost for repeated searches on large
+    genomes. Match start offsets (0-based, matching Python's re) are
+    reconstructed with running totals over the lengths of the
+    non-matching gaps and earlier matches — linear window functions, so
+    dense matches stay cheap — since regexp_matches itself does not
+    report offsets.
+
+    Returns a list of (start, matched_sequence) tuples, or None so the
+    caller can fall back to the in-Python path when the server rejects
+    the pattern (PostgreSQL's POSIX engine does not support every
+    Python re feature) or when the pattern produces zero-length matches,
+    whose offsets cannot be reconstructed from regexp_split_to_table.
+    """
+    sql = """
+        WITH seq AS (
+            SELECT sequence FROM genomes WHERE genome_id = %s
+        ),
+        gaps AS (
+            SELECT g.part, g.ord
+            FROM seq, regexp_split_to_table(seq.sequence, %s) WITH ORDINALITY AS g(part, ord)
+        ),
+        hits AS (
+            -- Wrap the pattern in a group so groups[1] is always the
+            -- full match, regardless of groups inside the pattern.
+            SELECT m.groups[1] AS matched, m.ord
+            FROM seq, regexp_matches(seq.sequence, '(' || %s || ')', 'g') WITH ORDINALITY AS m(groups, ord)
+        )
+        SELECT
+            SUM(length(gaps.part)) OVER (ORDER BY hits.ord)
+            + COALESCE(SUM(length(hits.matched)) OVER (
+                  ORDER BY hits.ord ROWS BETWEEN UNBOUNDED PRECEDING AND 1 PRECEDING
+              ), 0) AS match_start,
+            hits.matched
+        FROM hits
+        JOIN gaps ON gaps.ord = hits.ord
+        ORDER BY hits.ord;
+    """
+    try:
+        with conn.cursor() as cur:
+            cur.execute(sql, (genome_id, regex_pattern, regex_pattern))
+            rows = cur.fetchall()
+    except psycopg2.Error:
+        conn.rollback()
+        return None
+    # regexp_split_to_table ignores zero-length matches, which silently
+    # misaligns the gap/hit ordinality above — bail out so the caller
+    # uses the in-Python path instead of returning wrong offsets.
+    if any(matched == '' for _, matched in rows):
+        return None
+    return rows
+
+def count_pattern_matches(conn, genome_id, regex_pattern):
+    """
+    Counts pattern matches server-side without transferring the sequence
+    or the matches themselves — ideal for cheap "does this motif appear
+    at all?" queries. Returns None if the server rejects the pattern so
+    the caller can fall back to the in-Python path.
+    """
+    sql = """
+        SELECT count(*)
+        FROM genomes, regexp_matches(sequence, %s, 'g')
+        WHERE genome_id = %s;
+    """
+    try:
+        with conn.cursor() as cur:
+            cur.execute(sql, (regex_pattern, genome_id))
+            return cur.fetchone()[0]
+    except psycopg2.Error:
+        conn.rollback()
+        return None
+
 def close_connection_pool():
     """Closes all connections in the pool at the end of the script."""
     if connection_pool:
@@ -1,6 +1,6 @@
 import db_utils
 import analysis_functions
-from psycopg2.extras import execute_batch # Import the high-performance tool
+from psycopg2.extras import execute_values # Import the high-performance tool
 
 def setup_patterns():
     """
@@ -27,6 +27,10 @@ def search_and_log_patterns(genome_id_to_search: int):
     """Searches for all known patterns in a given sequence and logs any matches."""
     print(f"\n--- Step 2: Searching for Patterns in Genome ID: {genome_id_to_search} ---")
     conn = db_utils.get_connection()
+    # Run the whole select -> scan -> insert cycle as one explicit
+    # transaction: a single commit means a single fsync on the server.
+    previous_autocommit = conn.autocommit
+    conn.autocommit = False
     try:
         with conn.cursor() as cur:
             cur.execute("SELECT sequence FROM genomes WHERE genome_id = %s;", (genome_id_to_search,))
@@ -39,21 +43,38 @@ def search_and_log_patterns(genome_id_to_search: int):
             cur.execute("SELECT pattern_id, regex_pattern, pattern_name FROM patterns;")
             all_patterns = cur.fetchall()
 
-            for pattern_id, regex_pattern, pattern_name in all_patterns:
-                matches = analysis_functions.find_patterns_regex(sequence, regex_pattern)
+            # Scan the sequence once for all patterns (single-pass with
+            # Hyperscan when installed), then insert every match in one
+            # multi-row statement instead of one round-trip per match.
+            pattern_names = {pattern_id: name for pattern_id, _, name in all_patterns}
+            match_map = analysis_functions.scan_all_patterns(
+                sequence,
+                [(pattern_id, regex_pattern) for pattern_id, regex_pattern, _ in all_patterns]
+            )
+            rows = []
+            for pattern_id, matches in match_map.items():
                 if matches:
-                    print(f"Found {len(matches)} match(es) for pattern '{pattern_name}'")
-                    for match in matches:
-                        cur.execute("""
-                            INSERT INTO search_results (genome_id, pattern_id, match_start, match_end, matched_sequence)
-                            VALUES (%s, %s, %s, %s, %s)
-                        """, (genome_id_to_search, pattern_id, match['start'], match['end'], match['matched_sequence']))
+                    print(f"Found {len(matches)} match(es) for pattern '{pattern_names[pattern_id]}'")
+                    rows.extend(
+                        (genome_id_to_search, pattern_id, start, end, matched_sequence)
+                        for start, end, matched_sequence in matches
+                    )
+            if rows:
+                execute_values(cur, """
+                    INSERT INTO search_results (genome_id, pattern_id, match_start, match_end, matched_sequence)
+                    VALUES %s
+                """, rows, page_size=500)
             conn.commit()
             print("✅ Pattern search and logging complete.")
     except Exception as e:
         conn.rollback()
         print(f"An error occurred during pattern search: {e}")
     finally:
+        if conn.autocommit != previous_autocommit:
+            # End any open transaction first; autocommit cannot be
+            # changed mid-transaction.
+            conn.rollback()
+            conn.autocommit = previous_autocommit
         db_utils.release_connection(conn)
 
 def compare_and_log_mutations(ref_genome_id: int, comp_genome_id: int):
@@ -63,12 +84,19 @@ def compare_and_log_mutations(ref_genome_id: int, comp_genome_id: int):
     """
     print(f"\n--- Step 3: Comparing Genome {ref_genome_id} (Ref) with {comp_genome_id} ---")
     conn = db_utils.get_connection()
+    # One explicit transaction around select -> analyze -> insert
+    previous_autocommit = conn.autocommit
+    conn.autocommit = False
     try:
         with conn.cursor() as cur:
-            cur.execute("SELECT sequence FROM genomes WHERE genome_id = %s;", (ref_genome_id,))
-            ref_sequence = cur.fetchone()[0]
-            cur.execute("SELECT sequence FROM genomes WHERE genome_id = %s;", (comp_genome_id,))
-            comp_sequence = cur.fetchone()[0]
+            # Fetch both genomes in one round-trip instead of two
+            cur.execute(
+                "SELECT genome_id, sequence FROM genomes WHERE genome_id = ANY(%s);",
+                ([ref_genome_id, comp_genome_id],)
+            )
+            sequences = dict(cur.fetchall())
+            ref_sequence = sequences[ref_genome_id]
+            comp_sequence = sequences[comp_genome_id]
 
             mutations = analysis_functions.detect_mutations_simple(ref_sequence, comp_sequence)
             
@@ -90,14 +118,15 @@ def compare_and_log_mutations(ref_genome_id: int, comp_genome_id: int):
                     mutation['mutated']
                 ))
 
-            # 2. Define the SQL template
+            # 2. Define the SQL template (execute_values expands the single
+            #    VALUES %s placeholder into a multi-row VALUES list per page)
             sql_template = """
                 INSERT INTO mutations (genome_id, mutation_type, position, original_sequence, mutated_sequence)
-                VALUES (%s, %s, %s, %s, %s)
+                VALUES %s
             """
 
             # 3. Execute the batch operation once
-            execute_batch(cur, sql_template, mutations_to_log)
+            execute_values(cur, sql_template, mutations_to_log, page_size=1000)
             # --- END OF EFFICIENT BATCH INSERT ---
 
             conn.commit()
@@ -108,12 +137,18 @@ def compare_and_log_mutations(ref_genome_id: int, comp_genome_id: int):
         if conn:
             conn.rollback()
     finally:
+        if conn.autocommit != previous_autocommit:
+            # End any open transaction first; autocommit cannot be
+            # changed mid-transaction.
+            conn.rollback()
+            conn.autocommit = previous_autocommit
         db_utils.release_connection(conn)
 
 def main():
     """Main function to run the focused analysis workflow."""
     try:
         db_utils.init_connection_pool()
+        analysis_functions.warm_up_jit()  # Pre-pay JIT compilation at startup
         #setup_patterns()
         search_and_log_patterns(genome_id_to_search=3)
         compare_and_log_mutations(ref_genome_id=1, comp_genome_id=3)
@@ -1,14 +1,18 @@
 import os
 import csv
-from Bio import SeqIO  # The key library for parsing FASTA files
+from Bio.SeqIO.FastaIO import SimpleFastaParser  # Lightweight (description, sequence) tuples
 
 # --- Configuration ---
 # The name of your large FASTA file inside the 'data' folder
-INPUT_FASTA_PATH = os.path.join('data', 'sequence.fasta') 
+INPUT_FASTA_PATH = os.path.join('data', 'sequence.fasta')
 # The name of the clean CSV file we will create
-OUTPUT_CSV_PATH = os.path.join('data', 'processed_sequences.csv') 
+OUTPUT_CSV_PATH = os.path.join('data', 'processed_sequences.csv')
 # The maximum number of characters to keep from each sequence
 SEQUENCE_LENGTH_LIMIT = 100000
+# Write CSV rows (and report progress) in chunks of this many records
+BATCH_SIZE = 1000
+# Explicit 1 MiB I/O buffers to cut down on read/write syscalls
+IO_BUFFER_SIZE = 1 << 20
 
 def process_fasta_file():
     """
@@ -17,34 +21,37 @@ def process_fasta_file():
     """
     try:
         print(f"Opening input FASTA file: {INPUT_FASTA_PATH}")
-        with open(INPUT_FASTA_PATH, mode='r') as infile, \
-             open(OUTPUT_CSV_PATH, mode='w', newline='') as outfile:
+        with open(INPUT_FASTA_PATH, mode='r', buffering=IO_BUFFER_SIZE) as infile, \
+             open(OUTPUT_CSV_PATH, mode='w', newline='', buffering=IO_BUFFER_SIZE) as outfile:
 
             # Create a CSV writer that quotes ALL fields for consistency
             writer = csv.writer(outfile, quoting=csv.QUOTE_ALL)
-            
+
             # Write the header row that matches the database schema
             writer.writerow(['genome_id', 'description', 'sequence'])
-            
+
             print("Processing FASTA records...")
             genome_id_counter = 0
-            
-            # SeqIO.parse is a memory-efficient generator.
-            for record in SeqIO.parse(infile, "fasta"):
+            batch = []
+
+            # SimpleFastaParser streams plain (description, sequence) tuples,
+            # skipping SeqRecord object construction entirely.
+            for description, sequence_str in SimpleFastaParser(infile):
                 # Increment our integer ID for each new record
                 genome_id_counter += 1
-                
-                # Extract the full sequence as a string
-                sequence_str = str(record.seq)
-                
-                # Truncate the sequence to the defined limit
-                truncated_sequence = sequence_str[:SEQUENCE_LENGTH_LIMIT]
-                
-                # Write the processed data to the CSV file
-                # Use our new integer ID and the full FASTA description
-                writer.writerow([genome_id_counter, record.description, truncated_sequence])
-                
-                print(f"Processed {genome_id_counter} records...", end='\r')
+
+                # Truncate the sequence to the defined limit and queue the row
+                batch.append([genome_id_counter, description, sequence_str[:SEQUENCE_LENGTH_LIMIT]])
+
+                # Flush rows and report progress once per batch, not per
+                # record — a print is a syscall, and these add up.
+                if genome_id_counter % BATCH_SIZE == 0:
+                    writer.writerows(batch)
+                    batch.clear()
+                    print(f"Processed {genome_id_counter} records...")
+
+            if batch:
+                writer.writerows(batch)
 
             print(f"\n✅ Successfully processed {genome_id_counter} records.")
             print(f"Clean CSV created at: {OUTPUT_CSV_PATH}")
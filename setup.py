@@ -0,0 +1,23 @@
+"""
+Builds the optional _seqdiff C extension used by analysis_functions for
+fast mutation detection:
+
+    python setup.py build_ext --inplace
+
+Everything falls back to the NumPy/Numba paths if the extension is not
+built. Drop '-mavx2' below to build for CPUs without AVX2; the plain
+8-byte SWAR path is used instead.
+"""
+from setuptools import setup, Extension
+
+setup(
+    name='genetic-analyzer-seqdiff',
+    version='0.1',
+    ext_modules=[
+        Extension(
+            '_seqdiff',
+            sources=['src/_seqdiff.c'],
+            extra_compile_args=['-O3', '-mavx2'],
+        )
+    ],
+)
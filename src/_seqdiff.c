@@ -0,0 +1,111 @@
+/*
+ * _seqdiff: fast mismatch scan for two byte sequences.
+ *
+ * Compares sequences 8 bytes at a time with a single XOR (or 32 bytes at
+ * a time with AVX2 compare + movemask when compiled with -mavx2) and only
+ * drops to per-byte work where a block actually differs. On the
+ * highly-similar genomes this project compares, long identical runs
+ * retire in one word/vector op each.
+ */
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+#include <stdint.h>
+#include <string.h>
+#ifdef __AVX2__
+#include <immintrin.h>
+#endif
+
+static int
+append_position(PyObject *out, Py_ssize_t pos)
+{
+    PyObject *item = PyLong_FromSsize_t(pos);
+    if (item == NULL)
+        return -1;
+    if (PyList_Append(out, item) < 0) {
+        Py_DECREF(item);
+        return -1;
+    }
+    Py_DECREF(item);
+    return 0;
+}
+
+static PyObject *
+find_diffs(PyObject *self, PyObject *args)
+{
+    Py_buffer a, b;
+    if (!PyArg_ParseTuple(args, "y*y*", &a, &b))
+        return NULL;
+
+    const uint8_t *pa = (const uint8_t *)a.buf;
+    const uint8_t *pb = (const uint8_t *)b.buf;
+    Py_ssize_t n = a.len < b.len ? a.len : b.len;
+    Py_ssize_t i = 0;
+
+    PyObject *out = PyList_New(0);
+    if (out == NULL)
+        goto fail;
+
+#ifdef __AVX2__
+    for (; i + 32 <= n; i += 32) {
+        __m256i va = _mm256_loadu_si256((const __m256i *)(pa + i));
+        __m256i vb = _mm256_loadu_si256((const __m256i *)(pb + i));
+        uint32_t mask = ~(uint32_t)_mm256_movemask_epi8(_mm256_cmpeq_epi8(va, vb));
+        while (mask) {
+            int bit = __builtin_ctz(mask);
+            if (append_position(out, i + bit) < 0)
+                goto fail;
+            mask &= mask - 1;
+        }
+    }
+#endif
+
+    /* SWAR: XOR 8 bytes at a time; ctz locates the mismatching byte. */
+    for (; i + 8 <= n; i += 8) {
+        uint64_t wa, wb;
+        memcpy(&wa, pa + i, 8);
+        memcpy(&wb, pb + i, 8);
+        uint64_t x = wa ^ wb;
+        while (x) {
+            int byte = __builtin_ctzll(x) >> 3;
+            if (append_position(out, i + byte) < 0)
+                goto fail;
+            x &= ~(UINT64_C(0xff) << (byte * 8));
+        }
+    }
+
+    for (; i < n; i++) {
+        if (pa[i] != pb[i] && append_position(out, i) < 0)
+            goto fail;
+    }
+
+    PyBuffer_Release(&a);
+    PyBuffer_Release(&b);
+    return out;
+
+fail:
+    Py_XDECREF(out);
+    PyBuffer_Release(&a);
+    PyBuffer_Release(&b);
+    return NULL;
+}
+
+static PyMethodDef seqdiff_methods[] = {
+    {"find_diffs", find_diffs, METH_VARARGS,
+     "find_diffs(a, b) -> list of positions where the byte sequences differ\n"
+     "over their common prefix length."},
+    {NULL, NULL, 0, NULL}
+};
+
+static struct PyModuleDef seqdiff_module = {
+    PyModuleDef_HEAD_INIT,
+    "_seqdiff",
+    "SWAR/AVX2-accelerated byte-sequence mismatch scan.",
+    -1,
+    seqdiff_methods
+};
+
+PyMODINIT_FUNC
+PyInit__seqdiff(void)
+{
+    return PyModule_Create(&seqdiff_module);
+}